@@ -3,6 +3,7 @@ Decoradores para el Sistema de Catequesis.
 Incluye decoradores para autenticación, autorización, logging, cache y más.
 """
 
+import sys
 import time
 import functools
 import logging
@@ -82,6 +83,9 @@ def authorize_profiles(*allowed_profiles: str):
                 if not user_profile:
                     raise AuthorizationError("Perfil de usuario no encontrado")
                 
+                # Internar el perfil para que la comparación con las constantes sea por identidad
+                user_profile = sys.intern(user_profile)
+                
                 if user_profile not in allowed_profiles:
                     raise InsufficientPermissionsError(f"Perfil requerido: {', '.join(allowed_profiles)}")
                 
@@ -163,6 +167,8 @@ def validate_parroquia_access(f: Callable) -> Callable:
             claims = get_jwt()
             user_parroquia_id = claims.get('parroquia_id')
             user_profile = claims.get('profile')
+            if user_profile:
+                user_profile = sys.intern(user_profile)
             
             # Los admins pueden acceder a cualquier parroquia
             if user_profile == UserProfileType.ADMIN.value:
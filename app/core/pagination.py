@@ -7,7 +7,7 @@ import math
 from typing import Any, Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
 from flask import request, url_for
-from app.utils.constants import SystemConstants
+from app.utils.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, MIN_PAGE_SIZE
 
 
 @dataclass
@@ -87,12 +87,12 @@ class Paginator:
             max_per_page: Máximo elementos por página permitido
         """
         self.page = max(1, page)
-        self.per_page = per_page or SystemConstants.DEFAULT_PAGE_SIZE
-        self.max_per_page = max_per_page or SystemConstants.MAX_PAGE_SIZE
+        self.per_page = per_page or DEFAULT_PAGE_SIZE
+        self.max_per_page = max_per_page or MAX_PAGE_SIZE
         
         # Validar per_page
-        if self.per_page < SystemConstants.MIN_PAGE_SIZE:
-            self.per_page = SystemConstants.MIN_PAGE_SIZE
+        if self.per_page < MIN_PAGE_SIZE:
+            self.per_page = MIN_PAGE_SIZE
         elif self.per_page > self.max_per_page:
             self.per_page = self.max_per_page
     
@@ -168,7 +168,7 @@ class RequestPaginator(Paginator):
             max_per_page: Máximo elementos por página permitido
         """
         page = request.args.get('page', 1, type=int)
-        per_page = request.args.get('per_page', SystemConstants.DEFAULT_PAGE_SIZE, type=int)
+        per_page = request.args.get('per_page', DEFAULT_PAGE_SIZE, type=int)
         
         super().__init__(page, per_page, max_per_page)
 
@@ -352,8 +352,8 @@ class CursorPaginator:
             max_per_page: Máximo elementos por página permitido
         """
         self.cursor = cursor
-        self.per_page = per_page or SystemConstants.DEFAULT_PAGE_SIZE
-        self.max_per_page = max_per_page or SystemConstants.MAX_PAGE_SIZE
+        self.per_page = per_page or DEFAULT_PAGE_SIZE
+        self.max_per_page = max_per_page or MAX_PAGE_SIZE
         
         if self.per_page > self.max_per_page:
             self.per_page = self.max_per_page
@@ -422,7 +422,7 @@ def paginate_query_result(
         page = request.args.get('page', 1, type=int)
     
     if per_page is None:
-        per_page = request.args.get('per_page', SystemConstants.DEFAULT_PAGE_SIZE, type=int)
+        per_page = request.args.get('per_page', DEFAULT_PAGE_SIZE, type=int)
     
     paginator = Paginator(page, per_page)
     _, pagination_info = paginator.paginate(total_count)
@@ -462,9 +462,9 @@ def validate_pagination_params(
     if page is None:
         page = 1
     if per_page is None:
-        per_page = SystemConstants.DEFAULT_PAGE_SIZE
+        per_page = DEFAULT_PAGE_SIZE
     if max_per_page is None:
-        max_per_page = SystemConstants.MAX_PAGE_SIZE
+        max_per_page = MAX_PAGE_SIZE
     
     # Validar página
     if not isinstance(page, int) or page < 1:
@@ -492,7 +492,7 @@ def get_pagination_from_request(max_per_page: int = None) -> Tuple[int, int]:
         tuple: (page, per_page) validados
     """
     page = request.args.get('page', 1, type=int)
-    per_page = request.args.get('per_page', SystemConstants.DEFAULT_PAGE_SIZE, type=int)
+    per_page = request.args.get('per_page', DEFAULT_PAGE_SIZE, type=int)
     
     return validate_pagination_params(page, per_page, max_per_page)
 
@@ -723,8 +723,8 @@ class InfiniteScrollPaginator:
             max_per_page: Máximo elementos por página
             cursor_field: Campo usado como cursor
         """
-        self.per_page = per_page or SystemConstants.DEFAULT_PAGE_SIZE
-        self.max_per_page = max_per_page or SystemConstants.MAX_PAGE_SIZE
+        self.per_page = per_page or DEFAULT_PAGE_SIZE
+        self.max_per_page = max_per_page or MAX_PAGE_SIZE
         self.cursor_field = cursor_field
         
         if self.per_page > self.max_per_page:
@@ -796,7 +796,7 @@ def quick_paginate(
         total_count = len(items)
     
     page = page or request.args.get('page', 1, type=int)
-    per_page = per_page or request.args.get('per_page', SystemConstants.DEFAULT_PAGE_SIZE, type=int)
+    per_page = per_page or request.args.get('per_page', DEFAULT_PAGE_SIZE, type=int)
     
     return paginate_query_result(total_count, items, page, per_page)
 
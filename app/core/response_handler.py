@@ -3,10 +3,11 @@ Manejador de respuestas estandarizado para el Sistema de Catequesis.
 Proporciona un formato consistente para todas las respuestas de la API.
 """
 
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Union
 from datetime import datetime
 from flask import jsonify, Response
 from app.core.exceptions import CatequesisBaseException
+from app.utils.constants import SystemMessages, ErrorCodes, ERROR_MESSAGES
 
 
 class ResponseHandler:
@@ -49,8 +50,8 @@ class ResponseHandler:
     
     @staticmethod
     def error(
-        message: str = "Ha ocurrido un error",
-        error_code: str = "GENERIC_ERROR",
+        message: Optional[str] = None,
+        error_code: str = ErrorCodes.GENERIC_ERROR,
         status_code: int = 500,
         details: Dict[str, Any] = None,
         field_errors: Dict[str, List[str]] = None
@@ -59,7 +60,7 @@ class ResponseHandler:
         Crea una respuesta de error estandarizada.
         
         Args:
-            message: Mensaje de error
+            message: Mensaje de error (por defecto, el mensaje estándar del código)
             error_code: Código de error interno
             status_code: Código de estado HTTP
             details: Detalles adicionales del error
@@ -68,6 +69,9 @@ class ResponseHandler:
         Returns:
             Response: Respuesta JSON de Flask
         """
+        if message is None:
+            message = ERROR_MESSAGES.get(error_code, "Ha ocurrido un error")
+        
         response_data = {
             "success": False,
             "message": message,
@@ -105,7 +109,7 @@ class ResponseHandler:
     @staticmethod
     def created(
         data: Any = None, 
-        message: str = "Recurso creado exitosamente",
+        message: str = SystemMessages.SUCCESS_CREATED,
         resource_id: Union[int, str] = None
     ) -> Response:
         """
@@ -125,7 +129,7 @@ class ResponseHandler:
     @staticmethod
     def updated(
         data: Any = None, 
-        message: str = "Recurso actualizado exitosamente"
+        message: str = SystemMessages.SUCCESS_UPDATED
     ) -> Response:
         """
         Crea una respuesta para recursos actualizados (200).
@@ -140,7 +144,7 @@ class ResponseHandler:
         return ResponseHandler.success(data, message, 200)
     
     @staticmethod
-    def deleted(message: str = "Recurso eliminado exitosamente") -> Response:
+    def deleted(message: str = SystemMessages.SUCCESS_DELETED) -> Response:
         """
         Crea una respuesta para recursos eliminados (200).
         
@@ -172,11 +176,11 @@ class ResponseHandler:
         else:
             message = f"{entity} no encontrado"
             
-        return ResponseHandler.error(message, "NOT_FOUND", 404)
+        return ResponseHandler.error(message, ErrorCodes.NOT_FOUND, 404)
     
     @staticmethod
     def bad_request(
-        message: str = "Solicitud inválida",
+        message: str = SystemMessages.ERROR_BAD_REQUEST,
         field_errors: Dict[str, List[str]] = None
     ) -> Response:
         """
@@ -189,10 +193,10 @@ class ResponseHandler:
         Returns:
             Response: Respuesta JSON de Flask
         """
-        return ResponseHandler.error(message, "BAD_REQUEST", 400, field_errors=field_errors)
+        return ResponseHandler.error(message, ErrorCodes.BAD_REQUEST, 400, field_errors=field_errors)
     
     @staticmethod
-    def unauthorized(message: str = "No autorizado") -> Response:
+    def unauthorized(message: str = SystemMessages.ERROR_UNAUTHORIZED) -> Response:
         """
         Crea una respuesta para acceso no autorizado (401).
         
@@ -202,10 +206,10 @@ class ResponseHandler:
         Returns:
             Response: Respuesta JSON de Flask
         """
-        return ResponseHandler.error(message, "UNAUTHORIZED", 401)
+        return ResponseHandler.error(message, ErrorCodes.UNAUTHORIZED, 401)
     
     @staticmethod
-    def forbidden(message: str = "Acceso prohibido") -> Response:
+    def forbidden(message: str = SystemMessages.ERROR_FORBIDDEN) -> Response:
         """
         Crea una respuesta para acceso prohibido (403).
         
@@ -215,7 +219,7 @@ class ResponseHandler:
         Returns:
             Response: Respuesta JSON de Flask
         """
-        return ResponseHandler.error(message, "FORBIDDEN", 403)
+        return ResponseHandler.error(message, ErrorCodes.FORBIDDEN, 403)
     
     @staticmethod
     def conflict(
@@ -232,7 +236,7 @@ class ResponseHandler:
         Returns:
             Response: Respuesta JSON de Flask
         """
-        return ResponseHandler.error(message, "CONFLICT", 409, details)
+        return ResponseHandler.error(message, ErrorCodes.CONFLICT, 409, details)
     
     @staticmethod
     def unprocessable_entity(
@@ -249,11 +253,11 @@ class ResponseHandler:
         Returns:
             Response: Respuesta JSON de Flask
         """
-        return ResponseHandler.error(message, "UNPROCESSABLE_ENTITY", 422, field_errors=field_errors)
+        return ResponseHandler.error(message, ErrorCodes.UNPROCESSABLE_ENTITY, 422, field_errors=field_errors)
     
     @staticmethod
     def internal_server_error(
-        message: str = "Error interno del servidor",
+        message: str = SystemMessages.ERROR_INTERNAL_SERVER,
         details: Dict[str, Any] = None
     ) -> Response:
         """
@@ -266,7 +270,7 @@ class ResponseHandler:
         Returns:
             Response: Respuesta JSON de Flask
         """
-        return ResponseHandler.error(message, "INTERNAL_SERVER_ERROR", 500, details)
+        return ResponseHandler.error(message, ErrorCodes.INTERNAL_SERVER_ERROR, 500, details)
     
     @staticmethod
     def paginated(
@@ -382,7 +386,7 @@ class ResponseHandler:
         message = f"Límite de velocidad excedido: {limit}"
         details = {"retry_after": retry_after} if retry_after else None
         
-        response = ResponseHandler.error(message, "RATE_LIMIT_EXCEEDED", 429, details)
+        response = ResponseHandler.error(message, ErrorCodes.RATE_LIMIT_EXCEEDED, 429, details)
         
         if retry_after:
             response[0].headers['Retry-After'] = str(retry_after)
@@ -410,7 +414,7 @@ class ResponseHandler:
             else:
                 message = "Servicio no disponible temporalmente"
                 
-        return ResponseHandler.error(message, "SERVICE_UNAVAILABLE", 503)
+        return ResponseHandler.error(message, ErrorCodes.SERVICE_UNAVAILABLE, 503)
     
     @staticmethod
     def custom_response(
@@ -440,7 +444,7 @@ class ResponseHandler:
         if success:
             return ResponseHandler.success(data, message, status_code, meta)
         else:
-            return ResponseHandler.error(message, error_code or "CUSTOM_ERROR", status_code, details)
+            return ResponseHandler.error(message, error_code or ErrorCodes.CUSTOM_ERROR, status_code, details)
 
 
 class PaginationHelper:
@@ -9,7 +9,18 @@ from typing import Any, Dict, List, Optional, Union
 from marshmallow import ValidationError
 
 from app.utils.constants import (
-    ValidationConstants, 
+    CEDULA_LENGTH,
+    MAX_ADDRESS_LENGTH,
+    MAX_CATEQUESIS_AGE,
+    MAX_CATEQUIZANDOS_PER_GROUP,
+    MAX_EMAIL_LENGTH,
+    MAX_NAME_LENGTH,
+    MIN_ATTENDANCE_PERCENTAGE,
+    MIN_ATTENDANCE_SESSIONS,
+    MIN_CATEQUESIS_AGE,
+    MIN_CATEQUIZANDOS_PER_GROUP,
+    MIN_NAME_LENGTH,
+    MIN_PASSWORD_LENGTH,
     RegexPatterns, 
     SystemMessages,
     UserProfileType,
@@ -83,13 +94,13 @@ class BaseValidator:
         return value.strip()
     
     @staticmethod
-    def validate_pattern(value: str, pattern: str, field_name: str, message: str = None) -> str:
+    def validate_pattern(value: str, pattern: Union[str, re.Pattern], field_name: str, message: str = None) -> str:
         """
         Valida que un valor coincida con un patrón regex.
         
         Args:
             value: Valor a validar
-            pattern: Patrón regex
+            pattern: Patrón regex (cadena o patrón compilado)
             field_name: Nombre del campo
             message: Mensaje de error personalizado
             
@@ -99,7 +110,10 @@ class BaseValidator:
         Raises:
             ValidationError: Si no coincide con el patrón
         """
-        if not re.match(pattern, value):
+        if isinstance(pattern, str):
+            pattern = re.compile(pattern)
+        
+        if not pattern.match(value):
             error_message = message or f"El campo '{field_name}' tiene un formato inválido"
             raise ValidationError(error_message)
         
@@ -126,12 +140,12 @@ class PersonValidator(BaseValidator):
         names = PersonValidator.validate_required(names, "nombres")
         names = PersonValidator.validate_length(
             names, "nombres", 
-            ValidationConstants.MIN_NAME_LENGTH, 
-            ValidationConstants.MAX_NAME_LENGTH
+            MIN_NAME_LENGTH, 
+            MAX_NAME_LENGTH
         )
         
         PersonValidator.validate_pattern(
-            names, RegexPatterns.NAME_PATTERN, "nombres",
+            names, RegexPatterns.NAME_RE, "nombres",
             "Los nombres solo pueden contener letras, espacios y algunos caracteres especiales"
         )
         
@@ -154,12 +168,12 @@ class PersonValidator(BaseValidator):
         surnames = PersonValidator.validate_required(surnames, "apellidos")
         surnames = PersonValidator.validate_length(
             surnames, "apellidos", 
-            ValidationConstants.MIN_NAME_LENGTH, 
-            ValidationConstants.MAX_NAME_LENGTH
+            MIN_NAME_LENGTH, 
+            MAX_NAME_LENGTH
         )
         
         PersonValidator.validate_pattern(
-            surnames, RegexPatterns.NAME_PATTERN, "apellidos",
+            surnames, RegexPatterns.NAME_RE, "apellidos",
             "Los apellidos solo pueden contener letras, espacios y algunos caracteres especiales"
         )
         
@@ -184,8 +198,8 @@ class PersonValidator(BaseValidator):
         # Limpiar la cédula
         clean_cedula = re.sub(r'[^\d]', '', cedula)
         
-        if len(clean_cedula) != ValidationConstants.CEDULA_LENGTH:
-            raise ValidationError(f"La cédula debe tener {ValidationConstants.CEDULA_LENGTH} dígitos")
+        if len(clean_cedula) != CEDULA_LENGTH:
+            raise ValidationError(f"La cédula debe tener {CEDULA_LENGTH} dígitos")
         
         if not validate_cedula_ecuador(clean_cedula):
             raise ValidationError("La cédula de identidad no es válida")
@@ -220,8 +234,8 @@ class PersonValidator(BaseValidator):
             raise ValidationError("La fecha de nacimiento no es válida")
         
         if for_catequesis and not is_valid_age_for_catequesis(birth_date):
-            min_age = ValidationConstants.MIN_CATEQUESIS_AGE
-            max_age = ValidationConstants.MAX_CATEQUESIS_AGE
+            min_age = MIN_CATEQUESIS_AGE
+            max_age = MAX_CATEQUESIS_AGE
             raise ValidationError(f"La edad debe estar entre {min_age} y {max_age} años para catequesis")
         
         return birth_date
@@ -241,7 +255,7 @@ class PersonValidator(BaseValidator):
             ValidationError: Si el email es inválido
         """
         email = PersonValidator.validate_required(email, "email")
-        email = PersonValidator.validate_length(email, "email", max_length=ValidationConstants.MAX_EMAIL_LENGTH)
+        email = PersonValidator.validate_length(email, "email", max_length=MAX_EMAIL_LENGTH)
         
         if not validate_email(email):
             raise ValidationError("El formato del email no es válido")
@@ -288,7 +302,7 @@ class PersonValidator(BaseValidator):
         address = PersonValidator.validate_required(address, "dirección")
         address = PersonValidator.validate_length(
             address, "dirección", 
-            max_length=ValidationConstants.MAX_ADDRESS_LENGTH
+            max_length=MAX_ADDRESS_LENGTH
         )
         
         return address.strip()
@@ -333,8 +347,8 @@ class CatequesisValidator(BaseValidator):
         Raises:
             ValidationError: Si la capacidad es inválida
         """
-        min_capacity = ValidationConstants.MIN_CATEQUIZANDOS_PER_GROUP
-        max_capacity = ValidationConstants.MAX_CATEQUIZANDOS_PER_GROUP
+        min_capacity = MIN_CATEQUIZANDOS_PER_GROUP
+        max_capacity = MAX_CATEQUIZANDOS_PER_GROUP
         
         if not isinstance(capacity, int):
             raise ValidationError("La capacidad debe ser un número entero")
@@ -414,7 +428,7 @@ class CatequesisValidator(BaseValidator):
         """
         catequista_type = CatequesisValidator.validate_required(catequista_type, "tipo de catequista")
         
-        valid_types = [t.value for t in CatequistaType]
+        valid_types = CatequistaType.VALUES
         if catequista_type not in valid_types:
             raise ValidationError(f"El tipo de catequista debe ser uno de: {', '.join(valid_types)}")
         
@@ -461,7 +475,7 @@ class CatequesisValidator(BaseValidator):
         """
         method = CatequesisValidator.validate_required(method, "método de pago")
         
-        valid_methods = [m.value for m in PaymentMethod]
+        valid_methods = PaymentMethod.VALUES
         if method not in valid_methods:
             raise ValidationError(f"El método de pago debe ser uno de: {', '.join(valid_methods)}")
         
@@ -510,7 +524,7 @@ class UserValidator(BaseValidator):
         """
         password = UserValidator.validate_required(password, "contraseña")
         
-        min_length = ValidationConstants.MIN_PASSWORD_LENGTH
+        min_length = MIN_PASSWORD_LENGTH
         if len(password) < min_length:
             raise ValidationError(f"La contraseña debe tener al menos {min_length} caracteres")
         
@@ -539,7 +553,7 @@ class UserValidator(BaseValidator):
         """
         profile = UserValidator.validate_required(profile, "perfil de usuario")
         
-        valid_profiles = [p.value for p in UserProfileType]
+        valid_profiles = UserProfileType.VALUES
         if profile not in valid_profiles:
             raise ValidationError(f"El perfil debe ser uno de: {', '.join(valid_profiles)}")
         
@@ -568,8 +582,8 @@ class BusinessRuleValidator:
             enrollment_date = get_current_date()
         
         age = calculate_age(birth_date, enrollment_date)
-        min_age = ValidationConstants.MIN_CATEQUESIS_AGE
-        max_age = ValidationConstants.MAX_CATEQUESIS_AGE
+        min_age = MIN_CATEQUESIS_AGE
+        max_age = MAX_CATEQUESIS_AGE
         
         if age < min_age:
             raise ValidationError(f"El catequizando debe tener al menos {min_age} años")
@@ -625,13 +639,13 @@ class BusinessRuleValidator:
             return True
         
         attendance_percentage = (attended_sessions / total_sessions) * 100
-        min_percentage = ValidationConstants.MIN_ATTENDANCE_PERCENTAGE
+        min_percentage = MIN_ATTENDANCE_PERCENTAGE
         
         if attendance_percentage < min_percentage:
             raise ValidationError(f"Se requiere al menos {min_percentage}% de asistencia")
         
-        if attended_sessions < ValidationConstants.MIN_ATTENDANCE_SESSIONS:
-            min_sessions = ValidationConstants.MIN_ATTENDANCE_SESSIONS
+        if attended_sessions < MIN_ATTENDANCE_SESSIONS:
+            min_sessions = MIN_ATTENDANCE_SESSIONS
             raise ValidationError(f"Se requiere al menos {min_sessions} sesiones de asistencia")
         
         return True
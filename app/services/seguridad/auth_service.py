@@ -7,7 +7,6 @@ from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_
-from passlib.context import CryptContext
 from jose import JWTError, jwt
 import secrets
 import uuid
@@ -30,6 +29,7 @@ from app.core.exceptions import (
     NotFoundException, BusinessLogicException
 )
 from app.utils.email import send_email
+from app.utils.encryption import pwd_context
 from app.utils.rate_limit import RateLimiter
 from app.utils.device_detection import get_device_info
 import logging
@@ -42,7 +42,7 @@ class AuthService:
     
     def __init__(self, db: Session):
         self.db = db
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+        self.pwd_context = pwd_context
         self.rate_limiter = RateLimiter()
         
     # ==========================================
@@ -135,6 +135,10 @@ class AuthService:
             user.intentos_fallidos = 0
             user.bloqueado_hasta = None
             
+            # Migrar hashes bcrypt antiguos al esquema actual
+            if self.pwd_context.needs_update(user.password_hash):
+                user.password_hash = self._hash_password(password)
+            
             self.db.commit()
             
             # Log de login exitoso
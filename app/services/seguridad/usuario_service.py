@@ -7,8 +7,9 @@ from typing import Dict, Any, List, Optional, Type
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import and_, or_, func, text
-from passlib.context import CryptContext
 import secrets
+import smtplib
+import time
 
 from app.services.base_service import BaseService
 from app.models.seguridad.usuario_model import Usuario
@@ -23,17 +24,29 @@ from app.core.exceptions import (
     ValidationException, NotFoundException, BusinessLogicException,
     DuplicateException
 )
+from app.utils.constants import SystemConstants
 from app.utils.email import send_email
+from app.utils.encryption import pwd_context
 from app.utils.image_processor import process_avatar_image
 from app.utils.password_validator import validate_password_strength
 import logging
 
 logger = logging.getLogger(__name__)
+_warn = logger.warning
+
+# Vista indexada con la distribución de usuarios activos por perfil.
+# Se crea en el despliegue con scripts/sql/create_vw_roles_distribution.sql.
+ROLES_DISTRIBUTION_VIEW = "usuarios.vw_roles_distribution"
 
 
 class UsuarioService(BaseService):
     """Servicio para gestión completa de usuarios."""
     
+    # Resultado cacheado de la verificación de la vista indexada de roles
+    # (se revalida cada SystemConstants.CACHE_TTL_SHORT segundos)
+    _roles_view_available: bool = False
+    _roles_view_checked_at: Optional[float] = None
+    
     @property
     def model(self) -> Type[Usuario]:
         return Usuario
@@ -56,7 +69,7 @@ class UsuarioService(BaseService):
     
     def __init__(self, db: Session = None, current_user: Dict = None):
         super().__init__(db, current_user)
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+        self.pwd_context = pwd_context
     
     # ==========================================
     # OPERACIONES CRUD EXTENDIDAS
@@ -555,11 +568,7 @@ class UsuarioService(BaseService):
             ).distinct().count()
             
             # Distribución por roles
-            roles_distribution = self.db.query(
-                Rol.nombre, func.count(UsuarioRol.usuario_id)
-            ).join(UsuarioRol).join(Usuario).filter(
-                Usuario.activo == True
-            ).group_by(Rol.nombre).all()
+            roles_distribution = self._get_roles_distribution()
             
             base_stats.update({
                 'total_users': total_users,
@@ -591,6 +600,44 @@ class UsuarioService(BaseService):
         """Verifica contraseña contra hash."""
         return self.pwd_context.verify(plain_password, hashed_password)
     
+    def _get_roles_distribution(self) -> List[tuple]:
+        """Obtiene la distribución de usuarios activos por rol."""
+        if self._roles_distribution_view_exists():
+            return self.db.execute(
+                text(f"SELECT nombre, n FROM {ROLES_DISTRIBUTION_VIEW} WITH (NOEXPAND)")
+            ).all()
+        
+        # La vista no está desplegada: calcular la agregación directamente
+        return self.db.query(
+            Rol.nombre, func.count(UsuarioRol.usuario_id)
+        ).join(UsuarioRol).join(Usuario).filter(
+            Usuario.activo == True
+        ).group_by(Rol.nombre).all()
+    
+    def _roles_distribution_view_exists(self) -> bool:
+        """
+        Verifica si la vista indexada está desplegada. El resultado se cachea por
+        proceso y se revalida periódicamente, de modo que una vista creada o
+        eliminada después del arranque se detecta sin reiniciar.
+        Se consulta OBJECT_ID en lugar de capturar el error de la consulta para
+        no invalidar la transacción en curso de la sesión.
+        """
+        cls = type(self)
+        now = time.monotonic()
+        checked_at = cls._roles_view_checked_at
+        
+        if checked_at is None or now - checked_at >= SystemConstants.CACHE_TTL_SHORT:
+            object_id = self.db.execute(
+                text("SELECT OBJECT_ID(:name, 'V')"),
+                {"name": ROLES_DISTRIBUTION_VIEW}
+            ).scalar()
+            cls._roles_view_available = object_id is not None
+            cls._roles_view_checked_at = now
+            if not cls._roles_view_available:
+                _warn("Vista %s no disponible; se usa la agregación directa", ROLES_DISTRIBUTION_VIEW)
+        
+        return cls._roles_view_available
+    
     def _generate_username(self, nombres: str, apellidos: str) -> str:
         """Genera username único basado en nombres y apellidos."""
         base_username = f"{nombres.split()[0].lower()}.{apellidos.split()[0].lower()}"
@@ -718,21 +765,21 @@ class UsuarioService(BaseService):
         try:
             # Implementar envío de email de bienvenida
             pass
-        except Exception as e:
-            logger.warning(f"No se pudo enviar email de bienvenida a {user.email}: {str(e)}")
+        except (smtplib.SMTPException, ConnectionError) as e:
+            _warn("No se pudo enviar email de bienvenida a %s: %s", user.email, e)
     
     def _send_email_verification(self, user: Usuario):
         """Envía email de verificación."""
         try:
             # Implementar envío de email de verificación
             pass
-        except Exception as e:
-            logger.warning(f"No se pudo enviar email de verificación a {user.email}: {str(e)}")
+        except (smtplib.SMTPException, ConnectionError) as e:
+            _warn("No se pudo enviar email de verificación a %s: %s", user.email, e)
     
     def _send_password_reset_notification(self, user: Usuario, temp_password: str = None):
         """Envía notificación de restablecimiento de contraseña."""
         try:
             # Implementar envío de notificación
             pass
-        except Exception as e:
-            logger.warning(f"No se pudo enviar notificación a {user.email}: {str(e)}")
\ No newline at end of file
+        except (smtplib.SMTPException, ConnectionError) as e:
+            _warn("No se pudo enviar notificación a %s: %s", user.email, e)
\ No newline at end of file
@@ -0,0 +1,42 @@
+"""
+Enums de uso poco frecuente del Sistema de Catequesis.
+Se cargan de forma diferida desde app.utils.constants.
+"""
+
+import sys
+from enum import Enum
+
+
+# ===============================================
+# ESTADOS DE PAGO
+# ===============================================
+
+class PaymentStatus(str, Enum):
+    """Estados de pago de inscripción."""
+    
+    PENDING = "pendiente"
+    PAID = "pagado"
+    OVERDUE = "vencido"
+    CANCELLED = "cancelado"
+
+
+PaymentStatus.VALUES = tuple(member.value for member in PaymentStatus)
+PaymentStatus.NAMES = tuple(member.name for member in PaymentStatus)
+
+
+# ===============================================
+# TIPOS DE SACRAMENTO
+# ===============================================
+
+class SacramentType(str, Enum):
+    """Tipos de sacramento."""
+    
+    # Los literales no ASCII no se internan automáticamente
+    BAUTISMO = "Bautismo"
+    RECONCILIACION = sys.intern("Reconciliación")
+    EUCARISTIA = sys.intern("Eucaristía")
+    CONFIRMACION = sys.intern("Confirmación")
+
+
+SacramentType.VALUES = tuple(member.value for member in SacramentType)
+SacramentType.NAMES = tuple(member.name for member in SacramentType)
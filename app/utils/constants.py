@@ -3,16 +3,36 @@ Constantes para el Sistema de Catequesis.
 Define todas las constantes utilizadas en el sistema.
 """
 
+import re
+import sys
+import importlib
 from enum import Enum
+from types import MappingProxyType
+
+
+def _class_values(cls) -> tuple:
+    """Obtiene los valores de las constantes de una clase, en orden de definición."""
+    return tuple(value for key, value in vars(cls).items() if key.isupper())
+
+
+class _Namespace:
+    """Base de las clases de constantes: solo agrupan valores, no se instancian."""
+    
+    __slots__ = ()
+    
+    def __new__(cls, *args, **kwargs):
+        raise TypeError("namespace class")
 
 
 # ===============================================
 # CONSTANTES GENERALES DEL SISTEMA
 # ===============================================
 
-class SystemConstants:
+class SystemConstants(_Namespace):
     """Constantes generales del sistema."""
     
+    __slots__ = ()
+    
     # Información del sistema
     SYSTEM_NAME = "Sistema de Catequesis"
     SYSTEM_VERSION = "1.0.0"
@@ -46,7 +66,7 @@ class SystemConstants:
 # TIPOS DE PERFIL DE USUARIO
 # ===============================================
 
-class UserProfileType(Enum):
+class UserProfileType(str, Enum):
     """Tipos de perfil de usuario en el sistema."""
     
     ADMIN = "admin"
@@ -56,35 +76,30 @@ class UserProfileType(Enum):
     CONSULTA = "consulta"
 
 
+UserProfileType.VALUES = tuple(member.value for member in UserProfileType)
+UserProfileType.NAMES = tuple(member.name for member in UserProfileType)
+
+
 # ===============================================
 # TIPOS DE CATEQUISTA
 # ===============================================
 
-class CatequistaType(Enum):
+class CatequistaType(str, Enum):
     """Tipos de catequista."""
     
     PRINCIPAL = "principal"
     APOYO = "apoyo"
 
 
-# ===============================================
-# ESTADOS DE PAGO
-# ===============================================
-
-class PaymentStatus(Enum):
-    """Estados de pago de inscripción."""
-    
-    PENDING = "pendiente"
-    PAID = "pagado"
-    OVERDUE = "vencido"
-    CANCELLED = "cancelado"
+CatequistaType.VALUES = tuple(member.value for member in CatequistaType)
+CatequistaType.NAMES = tuple(member.name for member in CatequistaType)
 
 
 # ===============================================
 # MÉTODOS DE PAGO
 # ===============================================
 
-class PaymentMethod(Enum):
+class PaymentMethod(str, Enum):
     """Métodos de pago disponibles."""
     
     CASH = "efectivo"
@@ -93,26 +108,19 @@ class PaymentMethod(Enum):
     CHECK = "cheque"
 
 
-# ===============================================
-# TIPOS DE SACRAMENTO
-# ===============================================
-
-class SacramentType(Enum):
-    """Tipos de sacramento."""
-    
-    BAUTISMO = "Bautismo"
-    RECONCILIACION = "Reconciliación"
-    EUCARISTIA = "Eucaristía"
-    CONFIRMACION = "Confirmación"
+PaymentMethod.VALUES = tuple(member.value for member in PaymentMethod)
+PaymentMethod.NAMES = tuple(member.name for member in PaymentMethod)
 
 
 # ===============================================
 # TIPOS DE NOTIFICACIÓN
 # ===============================================
 
-class NotificationType(Enum):
+class NotificationType(_Namespace):
     """Tipos de notificación del sistema."""
     
+    __slots__ = ()
+    
     # Notificaciones de inscripción
     INSCRIPCION_CONFIRMADA = "inscripcion_confirmada"
     PAGO_CONFIRMADO = "pago_confirmado"
@@ -137,26 +145,41 @@ class NotificationType(Enum):
     RECORDATORIO_GENERAL = "recordatorio_general"
 
 
+NotificationType.VALUES = _class_values(NotificationType)
+# from_value devuelve la cadena canónica del valor (KeyError si no existe)
+_NOTIFICATION_BY_VALUE = {value: value for value in NotificationType.VALUES}
+NotificationType.from_value = staticmethod(_NOTIFICATION_BY_VALUE.__getitem__)
+
+
 # ===============================================
 # ESTADOS DE CERTIFICADO
 # ===============================================
 
-class CertificateStatus(Enum):
+class CertificateStatus(_Namespace):
     """Estados de certificado."""
     
+    __slots__ = ()
+    
     PENDING = "pendiente"
     APPROVED = "aprobado"
     REJECTED = "rechazado"
     ISSUED = "emitido"
 
 
+CertificateStatus.VALUES = _class_values(CertificateStatus)
+_CERTIFICATE_STATUS_BY_VALUE = {value: value for value in CertificateStatus.VALUES}
+CertificateStatus.from_value = staticmethod(_CERTIFICATE_STATUS_BY_VALUE.__getitem__)
+
+
 # ===============================================
 # TIPOS DE RECORDATORIO
 # ===============================================
 
-class ReminderType(Enum):
+class ReminderType(_Namespace):
     """Tipos de recordatorio automático."""
     
+    __slots__ = ()
+    
     INICIO_INSCRIPCIONES = "inicio_inscripciones"
     FIN_INSCRIPCIONES = "fin_inscripciones"
     INICIO_CATEQUESIS = "inicio_catequesis"
@@ -166,13 +189,20 @@ class ReminderType(Enum):
     ASISTENCIA_BAJA = "asistencia_baja"
 
 
+ReminderType.VALUES = _class_values(ReminderType)
+_REMINDER_BY_VALUE = {value: value for value in ReminderType.VALUES}
+ReminderType.from_value = staticmethod(_REMINDER_BY_VALUE.__getitem__)
+
+
 # ===============================================
 # CONSTANTES DE VALIDACIÓN
 # ===============================================
 
-class ValidationConstants:
+class ValidationConstants(_Namespace):
     """Constantes para validación de datos."""
     
+    __slots__ = ()
+    
     # Longitudes de campos
     MIN_NAME_LENGTH = 2
     MAX_NAME_LENGTH = 100
@@ -212,36 +242,68 @@ class ValidationConstants:
 # EXPRESIONES REGULARES
 # ===============================================
 
-class RegexPatterns:
+class RegexPatterns(_Namespace):
     """Patrones de expresiones regulares para validación."""
     
+    __slots__ = ()
+    
     # Documento de identidad ecuatoriano
     CEDULA_PATTERN = r'^\d{10}$'
+    CEDULA_RE = re.compile(CEDULA_PATTERN)
     
     # Teléfono (formato ecuatoriano)
     PHONE_PATTERN = r'^(\+593|0)[0-9]{8,9}$'
+    PHONE_RE = re.compile(PHONE_PATTERN)
     MOBILE_PATTERN = r'^(\+593|0)[9][0-9]{8}$'
+    MOBILE_RE = re.compile(MOBILE_PATTERN)
+    # Teléfono y tipo (celular/fijo) en una sola pasada
+    PHONE_COMBINED_PATTERN = r'^(?P<prefix>\+593|0)(?:(?P<mobile>9\d{8})|(?P<landline>\d{8,9}))$'
+    PHONE_COMBINED_RE = re.compile(PHONE_COMBINED_PATTERN, re.ASCII)
     
     # Email
-    EMAIL_PATTERN = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+    # Repeticiones acotadas por etiqueta de dominio para evitar backtracking excesivo
+    EMAIL_PATTERN = (
+        r'^(?=.{1,254}$)[a-zA-Z0-9._%+-]+@'
+        r'[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?'
+        r'(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)*'
+        r'\.[a-zA-Z]{2,63}$'
+    )
+    EMAIL_RE = re.compile(EMAIL_PATTERN)
     
     # Nombres (solo letras, espacios y algunos caracteres especiales)
-    NAME_PATTERN = r"^[a-zA-ZáéíóúÁÉÍÓÚñÑ\s\-'\.]+$"
+    NAME_PATTERN = rf"^[a-zA-ZáéíóúÁÉÍÓÚñÑ\s\-'\.]{{1,{ValidationConstants.MAX_NAME_LENGTH}}}$"
+    NAME_RE = re.compile(NAME_PATTERN)
     
     # Código postal (Ecuador)
     POSTAL_CODE_PATTERN = r'^\d{6}$'
+    POSTAL_CODE_RE = re.compile(POSTAL_CODE_PATTERN)
     
     # Placa de vehículo (Ecuador)
     LICENSE_PLATE_PATTERN = r'^[A-Z]{3}-\d{3,4}$'
+    LICENSE_PLATE_RE = re.compile(LICENSE_PLATE_PATTERN)
+    
+    # Patrones compilados por nombre lógico
+    COMPILED = {
+        'cedula': CEDULA_RE,
+        'phone': PHONE_RE,
+        'mobile': MOBILE_RE,
+        'phone_combined': PHONE_COMBINED_RE,
+        'email': EMAIL_RE,
+        'name': NAME_RE,
+        'postal_code': POSTAL_CODE_RE,
+        'license_plate': LICENSE_PLATE_RE,
+    }
 
 
 # ===============================================
 # MENSAJES DEL SISTEMA
 # ===============================================
 
-class SystemMessages:
+class SystemMessages(_Namespace):
     """Mensajes estándar del sistema."""
     
+    __slots__ = ()
+    
     # Mensajes de éxito
     SUCCESS_CREATED = "Recurso creado exitosamente"
     SUCCESS_UPDATED = "Recurso actualizado exitosamente"
@@ -276,13 +338,34 @@ class SystemMessages:
     VALIDATION_INVALID_CEDULA = "Cédula inválida"
 
 
+# Los mensajes contienen espacios y acentos, por lo que no se internan solos
+for _name, _message in vars(SystemMessages).items():
+    if _name.isupper():
+        setattr(SystemMessages, _name, sys.intern(_message))
+del _name, _message
+
+
+class SystemMessagesBytes(_Namespace):
+    """Mensajes estándar del sistema precodificados en UTF-8."""
+    
+    __slots__ = ()
+
+
+for _name, _message in vars(SystemMessages).items():
+    if _name.isupper():
+        setattr(SystemMessagesBytes, _name, _message.encode('utf-8'))
+del _name, _message
+
+
 # ===============================================
 # CÓDIGOS DE ERROR
 # ===============================================
 
-class ErrorCodes:
+class ErrorCodes(_Namespace):
     """Códigos de error del sistema."""
     
+    __slots__ = ()
+    
     # Errores generales
     GENERIC_ERROR = "GENERIC_ERROR"
     VALIDATION_ERROR = "VALIDATION_ERROR"
@@ -290,6 +373,12 @@ class ErrorCodes:
     UNAUTHORIZED = "UNAUTHORIZED"
     FORBIDDEN = "FORBIDDEN"
     CONFLICT = "CONFLICT"
+    BAD_REQUEST = "BAD_REQUEST"
+    UNPROCESSABLE_ENTITY = "UNPROCESSABLE_ENTITY"
+    INTERNAL_SERVER_ERROR = "INTERNAL_SERVER_ERROR"
+    RATE_LIMIT_EXCEEDED = "RATE_LIMIT_EXCEEDED"
+    SERVICE_UNAVAILABLE = "SERVICE_UNAVAILABLE"
+    CUSTOM_ERROR = "CUSTOM_ERROR"
     
     # Errores de base de datos
     DATABASE_ERROR = "DATABASE_ERROR"
@@ -318,16 +407,36 @@ class ErrorCodes:
     PAYMENT_ERROR = "PAYMENT_ERROR"
 
 
+# Mensaje estándar de cada código de error (comparten el mismo objeto str)
+ERROR_MESSAGES = MappingProxyType({
+    ErrorCodes.VALIDATION_ERROR: SystemMessages.ERROR_VALIDATION,
+    ErrorCodes.NOT_FOUND: SystemMessages.ERROR_NOT_FOUND,
+    ErrorCodes.UNAUTHORIZED: SystemMessages.ERROR_UNAUTHORIZED,
+    ErrorCodes.FORBIDDEN: SystemMessages.ERROR_FORBIDDEN,
+    ErrorCodes.BAD_REQUEST: SystemMessages.ERROR_BAD_REQUEST,
+    ErrorCodes.INTERNAL_SERVER_ERROR: SystemMessages.ERROR_INTERNAL_SERVER,
+    ErrorCodes.DUPLICATE_RECORD: SystemMessages.ERROR_DUPLICATE,
+    ErrorCodes.BAUTISMO_REQUIRED: SystemMessages.ERROR_BAUTISMO_REQUIRED,
+    ErrorCodes.INVALID_LEVEL_PROGRESSION: SystemMessages.ERROR_INVALID_LEVEL_PROGRESSION,
+    ErrorCodes.INSUFFICIENT_ATTENDANCE: SystemMessages.ERROR_INSUFFICIENT_ATTENDANCE,
+    ErrorCodes.GROUP_CAPACITY_ERROR: SystemMessages.ERROR_GROUP_CAPACITY_EXCEEDED,
+    ErrorCodes.CAPACITY_EXCEEDED: SystemMessages.ERROR_GROUP_CAPACITY_EXCEEDED,
+    ErrorCodes.PAYMENT_ERROR: SystemMessages.ERROR_PAYMENT_REQUIRED,
+})
+
+
 # ===============================================
 # CONFIGURACIÓN DE ARCHIVOS
 # ===============================================
 
-class FileConstants:
+class FileConstants(_Namespace):
     """Constantes para manejo de archivos."""
     
+    __slots__ = ()
+    
     # Extensiones permitidas
-    ALLOWED_IMAGE_EXTENSIONS = {'jpg', 'jpeg', 'png', 'gif'}
-    ALLOWED_DOCUMENT_EXTENSIONS = {'pdf', 'doc', 'docx', 'txt'}
+    ALLOWED_IMAGE_EXTENSIONS = frozenset({'jpg', 'jpeg', 'png', 'gif'})
+    ALLOWED_DOCUMENT_EXTENSIONS = frozenset({'pdf', 'doc', 'docx', 'txt'})
     ALLOWED_ALL_EXTENSIONS = ALLOWED_IMAGE_EXTENSIONS | ALLOWED_DOCUMENT_EXTENSIONS
     
     # Tamaños máximos
@@ -342,28 +451,30 @@ class FileConstants:
     CERTIFICATES_DIR = "certificates"
     
     # Tipos MIME
-    IMAGE_MIME_TYPES = {
+    IMAGE_MIME_TYPES = MappingProxyType({
         'jpg': 'image/jpeg',
         'jpeg': 'image/jpeg',
         'png': 'image/png',
         'gif': 'image/gif'
-    }
+    })
     
-    DOCUMENT_MIME_TYPES = {
+    DOCUMENT_MIME_TYPES = MappingProxyType({
         'pdf': 'application/pdf',
         'doc': 'application/msword',
         'docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
         'txt': 'text/plain'
-    }
+    })
 
 
 # ===============================================
 # CONFIGURACIÓN DE REPORTES
 # ===============================================
 
-class ReportConstants:
+class ReportConstants(_Namespace):
     """Constantes para generación de reportes."""
     
+    __slots__ = ()
+    
     # Tipos de reporte
     REPORT_ATTENDANCE = "asistencia"
     REPORT_PAYMENTS = "pagos"
@@ -389,9 +500,11 @@ class ReportConstants:
 # CONFIGURACIÓN DE EMAIL
 # ===============================================
 
-class EmailConstants:
+class EmailConstants(_Namespace):
     """Constantes para envío de emails."""
     
+    __slots__ = ()
+    
     # Tipos de plantilla
     TEMPLATE_WELCOME = "welcome"
     TEMPLATE_ENROLLMENT_CONFIRMATION = "enrollment_confirmation"
@@ -414,9 +527,11 @@ class EmailConstants:
 # HTTP STATUS CODES PERSONALIZADOS
 # ===============================================
 
-class HTTPStatus:
+class HTTPStatus(_Namespace):
     """Códigos de estado HTTP utilizados en el sistema."""
     
+    __slots__ = ()
+    
     # Códigos de éxito
     OK = 200
     CREATED = 201
@@ -443,4 +558,81 @@ class HTTPStatus:
     NOT_IMPLEMENTED = 501
     BAD_GATEWAY = 502
     SERVICE_UNAVAILABLE = 503
-    GATEWAY_TIMEOUT = 504
\ No newline at end of file
+    GATEWAY_TIMEOUT = 504
+
+
+# Frases de estado precalculadas (evita consultar el enum http.HTTPStatus)
+_HTTP_REASONS = {
+    HTTPStatus.OK: "OK",
+    HTTPStatus.CREATED: "Created",
+    HTTPStatus.ACCEPTED: "Accepted",
+    HTTPStatus.NO_CONTENT: "No Content",
+    HTTPStatus.MOVED_PERMANENTLY: "Moved Permanently",
+    HTTPStatus.FOUND: "Found",
+    HTTPStatus.NOT_MODIFIED: "Not Modified",
+    HTTPStatus.BAD_REQUEST: "Bad Request",
+    HTTPStatus.UNAUTHORIZED: "Unauthorized",
+    HTTPStatus.FORBIDDEN: "Forbidden",
+    HTTPStatus.NOT_FOUND: "Not Found",
+    HTTPStatus.METHOD_NOT_ALLOWED: "Method Not Allowed",
+    HTTPStatus.CONFLICT: "Conflict",
+    HTTPStatus.UNPROCESSABLE_ENTITY: "Unprocessable Entity",
+    HTTPStatus.TOO_MANY_REQUESTS: "Too Many Requests",
+    HTTPStatus.INTERNAL_SERVER_ERROR: "Internal Server Error",
+    HTTPStatus.NOT_IMPLEMENTED: "Not Implemented",
+    HTTPStatus.BAD_GATEWAY: "Bad Gateway",
+    HTTPStatus.SERVICE_UNAVAILABLE: "Service Unavailable",
+    HTTPStatus.GATEWAY_TIMEOUT: "Gateway Timeout",
+}
+HTTPStatus.reason = staticmethod(_HTTP_REASONS.get)
+
+
+# ===============================================
+# CONSTANTES DE ACCESO DIRECTO
+# ===============================================
+# Alias a nivel de módulo para las constantes más consultadas, de modo que
+# los caminos calientes (paginación, validación) eviten el acceso por clase.
+
+DEFAULT_PAGE_SIZE = SystemConstants.DEFAULT_PAGE_SIZE
+MAX_PAGE_SIZE = SystemConstants.MAX_PAGE_SIZE
+MIN_PAGE_SIZE = SystemConstants.MIN_PAGE_SIZE
+
+DATE_FORMAT = SystemConstants.DATE_FORMAT
+DATETIME_FORMAT = SystemConstants.DATETIME_FORMAT
+TIME_FORMAT = SystemConstants.TIME_FORMAT
+
+MIN_NAME_LENGTH = ValidationConstants.MIN_NAME_LENGTH
+MAX_NAME_LENGTH = ValidationConstants.MAX_NAME_LENGTH
+MIN_PASSWORD_LENGTH = ValidationConstants.MIN_PASSWORD_LENGTH
+CEDULA_LENGTH = ValidationConstants.CEDULA_LENGTH
+MAX_EMAIL_LENGTH = ValidationConstants.MAX_EMAIL_LENGTH
+MAX_ADDRESS_LENGTH = ValidationConstants.MAX_ADDRESS_LENGTH
+MIN_CATEQUESIS_AGE = ValidationConstants.MIN_CATEQUESIS_AGE
+MAX_CATEQUESIS_AGE = ValidationConstants.MAX_CATEQUESIS_AGE
+MIN_CATEQUIZANDOS_PER_GROUP = ValidationConstants.MIN_CATEQUIZANDOS_PER_GROUP
+MAX_CATEQUIZANDOS_PER_GROUP = ValidationConstants.MAX_CATEQUIZANDOS_PER_GROUP
+MIN_ATTENDANCE_PERCENTAGE = ValidationConstants.MIN_ATTENDANCE_PERCENTAGE
+MIN_ATTENDANCE_SESSIONS = ValidationConstants.MIN_ATTENDANCE_SESSIONS
+
+
+# ===============================================
+# ENUMS DE CARGA DIFERIDA
+# ===============================================
+# Enums poco usados definidos en un submódulo privado; solo se construyen
+# la primera vez que se accede a ellos (PEP 562).
+
+_LAZY_ATTRIBUTES = {
+    'PaymentStatus': 'app.utils._constants_enums',
+    'SacramentType': 'app.utils._constants_enums',
+}
+
+
+def __getattr__(name: str):
+    """Carga bajo demanda las constantes definidas en submódulos."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -3,16 +3,42 @@ Utilidades para manejo de fechas y tiempo en el Sistema de Catequesis.
 Funciones específicas para trabajar con fechas, tiempo y períodos del sistema.
 """
 
+import bisect
 import calendar
-from datetime import datetime, date, time, timedelta
-from typing import List, Tuple, Optional, Union
-import pytz
-from app.utils.constants import SystemConstants
+import re
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from types import MappingProxyType
+from datetime import datetime, date, time, timedelta, timezone
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple, Optional, Union
+from zoneinfo import ZoneInfo
+from app.utils.constants import SystemConstants, DATE_FORMAT, DATETIME_FORMAT
 
 
 # Configuración de timezone
-ECUADOR_TZ = pytz.timezone(SystemConstants.DEFAULT_TIMEZONE)
-UTC_TZ = pytz.UTC
+ECUADOR_TZ = ZoneInfo(SystemConstants.DEFAULT_TIMEZONE)
+UTC_TZ = timezone.utc
+
+# Fecha fijada para el contexto actual (ver frozen_today)
+_TODAY_CTX: ContextVar[Optional[date]] = ContextVar("catequesis_today", default=None)
+
+# Nombres de días (lunes=0) y meses (índice 1-12) por idioma
+_WEEKDAY_NAMES = {
+    "es": ("Lunes", "Martes", "Miércoles", "Jueves", "Viernes", "Sábado", "Domingo"),
+}
+_MONTH_NAMES = {
+    "es": (
+        "", "Enero", "Febrero", "Marzo", "Abril", "Mayo", "Junio",
+        "Julio", "Agosto", "Septiembre", "Octubre", "Noviembre", "Diciembre"
+    ),
+}
+
+# Días hábiles en los primeros r días (0-6) a partir de cada día de la semana
+_BUSINESS_DAYS_TABLE = tuple(
+    tuple(sum(1 for offset in range(r) if (start + offset) % 7 < 5) for r in range(7))
+    for start in range(7)
+)
 
 
 def get_current_datetime(timezone_aware: bool = True) -> datetime:
@@ -33,11 +59,31 @@ def get_current_datetime(timezone_aware: bool = True) -> datetime:
 def get_current_date() -> date:
     """
     Obtiene la fecha actual.
+    Dentro de un bloque frozen_today devuelve la fecha fijada.
     
     Returns:
         date: Fecha actual
     """
-    return date.today()
+    today = _TODAY_CTX.get()
+    return today if today is not None else date.today()
+
+
+@contextmanager
+def frozen_today(today: date = None) -> Iterator[date]:
+    """
+    Fija la fecha actual durante un bloque (por ejemplo, una petición).
+    
+    Args:
+        today: Fecha a fijar (por defecto la fecha de hoy)
+        
+    Yields:
+        date: Fecha fijada
+    """
+    token = _TODAY_CTX.set(today or date.today())
+    try:
+        yield _TODAY_CTX.get()
+    finally:
+        _TODAY_CTX.reset(token)
 
 
 def get_current_time() -> time:
@@ -60,9 +106,13 @@ def convert_to_ecuador_time(dt: datetime) -> datetime:
     Returns:
         datetime: Datetime en timezone de Ecuador
     """
-    if dt.tzinfo is None:
+    tzinfo = dt.tzinfo
+    if tzinfo is ECUADOR_TZ:
+        return dt
+    
+    if tzinfo is None:
         # Asumir que es UTC si no tiene timezone
-        dt = UTC_TZ.localize(dt)
+        dt = dt.replace(tzinfo=UTC_TZ)
     
     return dt.astimezone(ECUADOR_TZ)
 
@@ -77,14 +127,118 @@ def convert_to_utc(dt: datetime) -> datetime:
     Returns:
         datetime: Datetime en UTC
     """
-    if dt.tzinfo is None:
+    tzinfo = dt.tzinfo
+    if tzinfo is UTC_TZ:
+        return dt
+    
+    if tzinfo is None:
         # Asumir que es timezone local si no tiene timezone
-        dt = ECUADOR_TZ.localize(dt)
+        dt = dt.replace(tzinfo=ECUADOR_TZ)
     
     return dt.astimezone(UTC_TZ)
 
 
-def parse_date(date_str: str, format_str: str = None) -> Optional[date]:
+def _parse_iso_date(date_str: str) -> Optional[date]:
+    """Parsea manualmente una fecha con forma exacta AAAA-MM-DD."""
+    if (len(date_str) != 10 or date_str[4] != '-' or date_str[7] != '-'
+            or not (date_str[:4] + date_str[5:7] + date_str[8:]).isdigit() or not date_str.isascii()):
+        return _strptime_date(date_str, "%Y-%m-%d")
+    try:
+        return date(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:]))
+    except ValueError:
+        return None
+
+
+def _parse_dmy_date(date_str: str) -> Optional[date]:
+    """Parsea manualmente una fecha con forma exacta DD/MM/AAAA."""
+    if (len(date_str) != 10 or date_str[2] != '/' or date_str[5] != '/'
+            or not (date_str[:2] + date_str[3:5] + date_str[6:]).isdigit() or not date_str.isascii()):
+        return _strptime_date(date_str, "%d/%m/%Y")
+    try:
+        return date(int(date_str[6:]), int(date_str[3:5]), int(date_str[:2]))
+    except ValueError:
+        return None
+
+
+def _strptime_date(date_str: str, format_str: str) -> Optional[date]:
+    """Parsea una fecha con strptime devolviendo None si no coincide."""
+    try:
+        return datetime.strptime(date_str, format_str).date()
+    except ValueError:
+        return None
+
+
+# Formatos alternativos que se prueban si falla el formato principal
+_COMMON_DATE_FORMATS = ("%Y-%m-%d", "%d-%m-%Y", "%m/%d/%Y", "%Y/%m/%d")
+_ISO_DATETIME_FORMATS = ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S.%f")
+
+# Formatos con parser manual (evitan strptime en el caso habitual)
+_FAST_DATE_PARSERS = {
+    "%Y-%m-%d": _parse_iso_date,
+    "%d/%m/%Y": _parse_dmy_date,
+}
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_cached(date_str: str, format_str: str) -> Optional[date]:
+    """Parsea una fecha con un formato concreto, cacheando el resultado."""
+    parser = _FAST_DATE_PARSERS.get(format_str)
+    if parser is not None:
+        return parser(date_str)
+    return _strptime_date(date_str, format_str)
+
+
+# Forma de una fecha numérica: grupo, separador, grupo, mismo separador, grupo
+_DATE_SHAPE_RE = re.compile(r'^(\d{1,4})([-/])(\d{1,2})\2(\d{1,4})$', re.ASCII)
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_by_shape(date_str: str) -> Optional[date]:
+    """
+    Parsea una fecha con los formatos alternativos según su forma.
+    Equivale a probar _COMMON_DATE_FORMATS en orden, sin invocar strptime.
+    """
+    match = _DATE_SHAPE_RE.match(date_str)
+    if match:
+        first, separator, middle, last = match.groups()
+        
+        if len(first) == 4 and len(last) <= 2:
+            # %Y-%m-%d o %Y/%m/%d
+            year, month, day = first, middle, last
+        elif len(first) <= 2 and len(last) == 4:
+            if separator == '-':
+                # %d-%m-%Y
+                day, month, year = first, middle, last
+            else:
+                # %m/%d/%Y
+                month, day, year = first, middle, last
+        else:
+            return None
+        
+        try:
+            return date(int(year), int(month), int(day))
+        except ValueError:
+            return None
+    
+    # Formas no numéricas estándar (p. ej. días con espacio): usar strptime
+    for fmt in _COMMON_DATE_FORMATS:
+        result = _parse_date_cached(date_str, fmt)
+        if result is not None:
+            return result
+    
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _parse_datetime_cached(datetime_str: str, format_str: str) -> Optional[datetime]:
+    """Parsea una fecha/hora con un formato concreto, cacheando el resultado."""
+    try:
+        return datetime.strptime(datetime_str, format_str)
+    except ValueError:
+        return None
+
+
+def parse_date(date_str: str, format_str: str = DATE_FORMAT) -> Optional[date]:
     """
     Parsea una cadena de fecha a objeto date.
     
@@ -99,29 +253,17 @@ def parse_date(date_str: str, format_str: str = None) -> Optional[date]:
         return None
     
     if format_str is None:
-        format_str = SystemConstants.DATE_FORMAT
+        format_str = DATE_FORMAT
     
-    try:
-        return datetime.strptime(date_str, format_str).date()
-    except ValueError:
-        # Intentar con otros formatos comunes
-        common_formats = [
-            "%Y-%m-%d",
-            "%d-%m-%Y",
-            "%m/%d/%Y",
-            "%Y/%m/%d"
-        ]
-        
-        for fmt in common_formats:
-            try:
-                return datetime.strptime(date_str, fmt).date()
-            except ValueError:
-                continue
-        
-        return None
+    result = _parse_date_cached(date_str, format_str)
+    if result is not None:
+        return result
+    
+    # Intentar con otros formatos comunes
+    return _parse_date_by_shape(date_str)
 
 
-def parse_datetime(datetime_str: str, format_str: str = None) -> Optional[datetime]:
+def parse_datetime(datetime_str: str, format_str: str = DATETIME_FORMAT) -> Optional[datetime]:
     """
     Parsea una cadena de fecha/hora a objeto datetime.
     
@@ -136,28 +278,22 @@ def parse_datetime(datetime_str: str, format_str: str = None) -> Optional[dateti
         return None
     
     if format_str is None:
-        format_str = SystemConstants.DATETIME_FORMAT
+        format_str = DATETIME_FORMAT
     
-    try:
-        return datetime.strptime(datetime_str, format_str)
-    except ValueError:
-        # Intentar con formatos ISO
-        iso_formats = [
-            "%Y-%m-%dT%H:%M:%S",
-            "%Y-%m-%d %H:%M:%S",
-            "%Y-%m-%dT%H:%M:%S.%f"
-        ]
-        
-        for fmt in iso_formats:
-            try:
-                return datetime.strptime(datetime_str, fmt)
-            except ValueError:
-                continue
-        
-        return None
+    result = _parse_datetime_cached(datetime_str, format_str)
+    if result is not None:
+        return result
+    
+    # Intentar con formatos ISO
+    for fmt in _ISO_DATETIME_FORMATS:
+        result = _parse_datetime_cached(datetime_str, fmt)
+        if result is not None:
+            return result
+    
+    return None
 
 
-def format_date(date_obj: date, format_str: str = None) -> str:
+def format_date(date_obj: date, format_str: str = DATE_FORMAT) -> str:
     """
     Formatea un objeto date a string.
     
@@ -172,12 +308,12 @@ def format_date(date_obj: date, format_str: str = None) -> str:
         return ""
     
     if format_str is None:
-        format_str = SystemConstants.DATE_FORMAT
+        format_str = DATE_FORMAT
     
     return date_obj.strftime(format_str)
 
 
-def format_datetime(datetime_obj: datetime, format_str: str = None, include_timezone: bool = False) -> str:
+def format_datetime(datetime_obj: datetime, format_str: str = DATETIME_FORMAT, include_timezone: bool = False) -> str:
     """
     Formatea un objeto datetime a string.
     
@@ -193,7 +329,7 @@ def format_datetime(datetime_obj: datetime, format_str: str = None, include_time
         return ""
     
     if format_str is None:
-        format_str = SystemConstants.DATETIME_FORMAT
+        format_str = DATETIME_FORMAT
     
     if include_timezone and datetime_obj.tzinfo:
         format_str += " %Z"
@@ -215,14 +351,10 @@ def get_age_in_years(birth_date: date, reference_date: date = None) -> int:
     if reference_date is None:
         reference_date = get_current_date()
     
-    age = reference_date.year - birth_date.year
-    
-    # Verificar si ya cumplió años este año
-    if reference_date.month < birth_date.month or \
-       (reference_date.month == birth_date.month and reference_date.day < birth_date.day):
-        age -= 1
-    
-    return age
+    # Restar un año si aún no cumple años en el año de referencia
+    return reference_date.year - birth_date.year - (
+        (reference_date.month, reference_date.day) < (birth_date.month, birth_date.day)
+    )
 
 
 def get_age_in_months(birth_date: date, reference_date: date = None) -> int:
@@ -239,13 +371,11 @@ def get_age_in_months(birth_date: date, reference_date: date = None) -> int:
     if reference_date is None:
         reference_date = get_current_date()
     
-    months = (reference_date.year - birth_date.year) * 12
-    months += reference_date.month - birth_date.month
-    
-    if reference_date.day < birth_date.day:
-        months -= 1
-    
-    return months
+    return (
+        (reference_date.year - birth_date.year) * 12
+        + reference_date.month - birth_date.month
+        - (reference_date.day < birth_date.day)
+    )
 
 
 def get_catequesis_year() -> int:
@@ -349,14 +479,10 @@ def get_weekday_name(date_obj: date, lang: str = "es") -> str:
     Returns:
         str: Nombre del día
     """
-    if lang == "es":
-        weekdays = [
-            "Lunes", "Martes", "Miércoles", "Jueves", 
-            "Viernes", "Sábado", "Domingo"
-        ]
-        return weekdays[date_obj.weekday()]
-    else:
+    names = _WEEKDAY_NAMES.get(lang)
+    if names is None:
         return date_obj.strftime("%A")
+    return names[date_obj.weekday()]
 
 
 def get_month_name(month: int, lang: str = "es") -> str:
@@ -370,14 +496,10 @@ def get_month_name(month: int, lang: str = "es") -> str:
     Returns:
         str: Nombre del mes
     """
-    if lang == "es":
-        months = [
-            "Enero", "Febrero", "Marzo", "Abril", "Mayo", "Junio",
-            "Julio", "Agosto", "Septiembre", "Octubre", "Noviembre", "Diciembre"
-        ]
-        return months[month - 1] if 1 <= month <= 12 else ""
-    else:
+    names = _MONTH_NAMES.get(lang)
+    if names is None:
         return calendar.month_name[month]
+    return names[month] if 1 <= month <= 12 else ""
 
 
 def get_date_range_for_month(year: int, month: int) -> Tuple[date, date]:
@@ -414,6 +536,27 @@ def get_date_range_for_year(year: int) -> Tuple[date, date]:
     return first_day, last_day
 
 
+def get_weekday_dates(start_date: date, end_date: date, weekday: int) -> List[date]:
+    """
+    Obtiene todas las fechas de un día de la semana dentro de un rango.
+    
+    Args:
+        start_date: Fecha de inicio (inclusive)
+        end_date: Fecha de fin (inclusive)
+        weekday: Día de la semana (0=lunes, 6=domingo)
+        
+    Returns:
+        list: Lista de fechas ordenadas
+    """
+    first = start_date + timedelta(days=(weekday - start_date.weekday()) % 7)
+    if first > end_date:
+        return []
+    
+    week = timedelta(days=7)
+    count = (end_date - first).days // 7 + 1
+    return [first + week * i for i in range(count)]
+
+
 def get_catequesis_session_dates(year: int = None) -> List[date]:
     """
     Genera las fechas de sesiones de catequesis para un año.
@@ -440,12 +583,7 @@ def get_catequesis_session_dates(year: int = None) -> List[date]:
     for year_month, month in months:
         # Obtener todos los sábados del mes
         first_day, last_day = get_date_range_for_month(year_month, month)
-        
-        current_date = first_day
-        while current_date <= last_day:
-            if current_date.weekday() == 5:  # Sábado
-                session_dates.append(current_date)
-            current_date += timedelta(days=1)
+        session_dates.extend(get_weekday_dates(first_day, last_day, 5))
     
     return session_dates
 
@@ -481,15 +619,14 @@ def get_business_days_count(start_date: date, end_date: date) -> int:
     if start_date > end_date:
         return 0
     
-    current_date = start_date
-    business_days = 0
+    # Semanas completas aportan 5 días hábiles; el resto se obtiene de la tabla
+    total_days = (end_date - start_date).days + 1
+    full_weeks, remainder = divmod(total_days, 7)
     
-    while current_date <= end_date:
-        if current_date.weekday() < 5:  # Lunes a viernes
-            business_days += 1
-        current_date += timedelta(days=1)
-    
-    return business_days
+    return full_weeks * 5 + _BUSINESS_DAYS_TABLE[start_date.weekday()][remainder]
+
+
+_EXPIRED_TIME_UNTIL = MappingProxyType({"days": 0, "hours": 0, "minutes": 0, "expired": True})
 
 
 def get_time_until_date(target_date: date) -> dict:
@@ -503,16 +640,18 @@ def get_time_until_date(target_date: date) -> dict:
         dict: Diccionario con días, horas, minutos restantes
     """
     current_datetime = get_current_datetime(timezone_aware=False)
-    target_datetime = datetime.combine(target_date, time.max)
+    # Último instante del día objetivo
+    target_datetime = datetime(target_date.year, target_date.month, target_date.day, 23, 59, 59, 999999)
     
     if target_datetime <= current_datetime:
-        return {"days": 0, "hours": 0, "minutes": 0, "expired": True}
+        return dict(_EXPIRED_TIME_UNTIL)
     
     time_diff = target_datetime - current_datetime
     
     days = time_diff.days
-    hours, remainder = divmod(time_diff.seconds, 3600)
-    minutes, _ = divmod(remainder, 60)
+    seconds = time_diff.seconds
+    hours = seconds // 3600
+    minutes = seconds % 3600 // 60
     
     return {
         "days": days,
@@ -548,6 +687,23 @@ def is_valid_birth_date(birth_date: date, min_age: int = 0, max_age: int = 120)
     return min_age <= age <= max_age
 
 
+_MINUTE = 60
+_HOUR = 3600
+_DAY = 86400
+_WEEK = 7 * _DAY
+_MONTH = 30 * _DAY
+_YEAR = 365 * _DAY
+
+_RELATIVE_TIME_UNITS = (
+    (_HOUR, _MINUTE, "minuto", "minutos"),
+    (_DAY, _HOUR, "hora", "horas"),
+    (_WEEK, _DAY, "día", "días"),
+    (4 * _WEEK, _WEEK, "semana", "semanas"),
+    (12 * _MONTH, _MONTH, "mes", "meses"),
+    (float("inf"), _YEAR, "año", "años"),
+)
+
+
 def get_relative_time_string(target_datetime: datetime, reference_datetime: datetime = None) -> str:
     """
     Obtiene una representación de tiempo relativo en español.
@@ -562,42 +718,20 @@ def get_relative_time_string(target_datetime: datetime, reference_datetime: date
     if reference_datetime is None:
         reference_datetime = get_current_datetime(timezone_aware=False)
     
-    time_diff = target_datetime - reference_datetime
+    total_seconds = (target_datetime - reference_datetime).total_seconds()
+    future = total_seconds > 0
+    abs_seconds = int(abs(total_seconds))
     
-    if time_diff.total_seconds() == 0:
+    if abs_seconds < _MINUTE:
         return "ahora"
     
-    future = time_diff.total_seconds() > 0
-    abs_diff = abs(time_diff.total_seconds())
+    # Primer umbral que no se supera: (límite, segundos por unidad, singular, plural)
+    for limit, unit_seconds, singular, plural in _RELATIVE_TIME_UNITS:
+        if abs_seconds < limit:
+            break
     
-    # Convertir a diferentes unidades
-    minutes = abs_diff / 60
-    hours = minutes / 60
-    days = hours / 24
-    weeks = days / 7
-    months = days / 30
-    years = days / 365
-    
-    if abs_diff < 60:
-        return "ahora"
-    elif minutes < 60:
-        unit = "minuto" if int(minutes) == 1 else "minutos"
-        time_str = f"{int(minutes)} {unit}"
-    elif hours < 24:
-        unit = "hora" if int(hours) == 1 else "horas"
-        time_str = f"{int(hours)} {unit}"
-    elif days < 7:
-        unit = "día" if int(days) == 1 else "días"
-        time_str = f"{int(days)} {unit}"
-    elif weeks < 4:
-        unit = "semana" if int(weeks) == 1 else "semanas"
-        time_str = f"{int(weeks)} {unit}"
-    elif months < 12:
-        unit = "mes" if int(months) == 1 else "meses"
-        time_str = f"{int(months)} {unit}"
-    else:
-        unit = "año" if int(years) == 1 else "años"
-        time_str = f"{int(years)} {unit}"
+    amount = abs_seconds // unit_seconds
+    time_str = f"{amount} {singular if amount == 1 else plural}"
     
     if future:
         return f"en {time_str}"
@@ -605,6 +739,7 @@ def get_relative_time_string(target_datetime: datetime, reference_datetime: date
         return f"hace {time_str}"
 
 
+@lru_cache(maxsize=32)
 def get_easter_date(year: int) -> date:
     """
     Calcula la fecha de Pascua para un año específico.
@@ -635,19 +770,34 @@ def get_easter_date(year: int) -> date:
     return date(year, month, day)
 
 
-def get_liturgical_season_dates(year: int) -> dict:
+def easter_for_years(years: Iterable[int]) -> List[date]:
+    """
+    Calcula la fecha de Pascua para varios años.
+    
+    Args:
+        years: Años a calcular
+        
+    Returns:
+        list: Fechas de Pascua en el mismo orden que los años
+    """
+    return [get_easter_date(year) for year in years]
+
+
+@lru_cache(maxsize=32)
+def get_liturgical_season_dates(year: int) -> MappingProxyType:
     """
     Obtiene las fechas importantes del calendario litúrgico.
+    El resultado se cachea por año y es de solo lectura.
     
     Args:
         year: Año
         
     Returns:
-        dict: Diccionario con fechas litúrgicas importantes
+        MappingProxyType: Mapeo con fechas litúrgicas importantes
     """
     easter = get_easter_date(year)
     
-    return {
+    return MappingProxyType({
         "epifania": date(year, 1, 6),
         "miercoles_ceniza": easter - timedelta(days=46),
         "domingo_ramos": easter - timedelta(days=7),
@@ -659,7 +809,7 @@ def get_liturgical_season_dates(year: int) -> dict:
         "corpus_christi": easter + timedelta(days=60),
         "sagrado_corazon": easter + timedelta(days=68),
         "navidad": date(year, 12, 25)
-    }
+    })
 
 
 def is_liturgical_season(season: str, reference_date: date = None) -> bool:
@@ -678,34 +828,70 @@ def is_liturgical_season(season: str, reference_date: date = None) -> bool:
     
     year = reference_date.year
     liturgical_dates = get_liturgical_season_dates(year)
+    navidad = liturgical_dates["navidad"]
     
-    if season == "adviento":
-        # 4 domingos antes de Navidad
-        advent_start = liturgical_dates["navidad"] - timedelta(days=28)
-        return advent_start <= reference_date <= liturgical_dates["navidad"]
+    # Adviento: 4 domingos antes de Navidad
+    in_adviento = navidad - timedelta(days=28) <= reference_date <= navidad
+    # Navidad: de Navidad a Epifanía del año siguiente
+    in_navidad = navidad <= reference_date <= date(year + 1, 1, 6)
+    # Cuaresma: de Miércoles de Ceniza a Jueves Santo
+    in_cuaresma = liturgical_dates["miercoles_ceniza"] <= reference_date <= liturgical_dates["jueves_santo"]
+    # Pascua: de Pascua a Pentecostés
+    in_pascua = liturgical_dates["pascua"] <= reference_date <= liturgical_dates["pentecostes"]
     
+    if season == "adviento":
+        return in_adviento
     elif season == "navidad":
-        # De Navidad a Epifanía
-        christmas_start = liturgical_dates["navidad"]
-        epiphany_next_year = date(year + 1, 1, 6)
-        return christmas_start <= reference_date <= epiphany_next_year
-    
+        return in_navidad
     elif season == "cuaresma":
-        # De Miércoles de Ceniza a Jueves Santo
-        return liturgical_dates["miercoles_ceniza"] <= reference_date <= liturgical_dates["jueves_santo"]
-    
+        return in_cuaresma
     elif season == "pascua":
-        # De Pascua a Pentecostés
-        return liturgical_dates["pascua"] <= reference_date <= liturgical_dates["pentecostes"]
-    
+        return in_pascua
     else:
         # Tiempo ordinario (el resto del año)
-        return not any([
-            is_liturgical_season("adviento", reference_date),
-            is_liturgical_season("navidad", reference_date),
-            is_liturgical_season("cuaresma", reference_date),
-            is_liturgical_season("pascua", reference_date)
-        ])
+        return not (in_adviento or in_navidad or in_cuaresma or in_pascua)
+
+
+def liturgical_season_classifier(year: int) -> Callable[[date], str]:
+    """
+    Crea un clasificador de temporadas litúrgicas para un año.
+    Los rangos se calculan una sola vez, útil para clasificar todos los días del año.
+    Navidad abarca del 25 de diciembre al 6 de enero, por lo que los primeros días
+    de enero pertenecen a la Navidad del año anterior.
+    
+    Args:
+        year: Año
+        
+    Returns:
+        Callable: Función que recibe una fecha del año y retorna la temporada
+                  (adviento, navidad, cuaresma, pascua u ordinario)
+    """
+    liturgical_dates = get_liturgical_season_dates(year)
+    navidad = liturgical_dates["navidad"]
+    adviento_start = navidad - timedelta(days=28)
+    adviento_end = navidad - timedelta(days=1)
+    navidad_end = date(year + 1, 1, 6)
+    previous_navidad_start = date(year - 1, 12, 25)
+    previous_navidad_end = date(year, 1, 6)
+    cuaresma_start = liturgical_dates["miercoles_ceniza"]
+    cuaresma_end = liturgical_dates["jueves_santo"]
+    pascua_start = liturgical_dates["pascua"]
+    pascua_end = liturgical_dates["pentecostes"]
+    
+    def classify(reference_date: date) -> str:
+        if navidad <= reference_date <= navidad_end:
+            return "navidad"
+        if previous_navidad_start <= reference_date <= previous_navidad_end:
+            return "navidad"
+        if adviento_start <= reference_date <= adviento_end:
+            return "adviento"
+        if cuaresma_start <= reference_date <= cuaresma_end:
+            return "cuaresma"
+        if pascua_start <= reference_date <= pascua_end:
+            return "pascua"
+        return "ordinario"
+    
+    return classify
 
 
 def get_confirmation_season_dates(year: int) -> List[date]:
@@ -718,23 +904,15 @@ def get_confirmation_season_dates(year: int) -> List[date]:
     Returns:
         list: Lista de fechas probables para confirmaciones
     """
-    confirmation_dates = []
+    # Sábados de mayo y junio (ya ordenados)
+    confirmation_dates = get_weekday_dates(date(year, 5, 1), date(year, 6, 30), 5)
     
     # Pentecostés (fecha tradicional)
-    liturgical_dates = get_liturgical_season_dates(year)
-    confirmation_dates.append(liturgical_dates["pentecostes"])
-    
-    # Sábados de mayo y junio
-    for month in [5, 6]:
-        first_day, last_day = get_date_range_for_month(year, month)
-        current_date = first_day
-        
-        while current_date <= last_day:
-            if current_date.weekday() == 5:  # Sábado
-                confirmation_dates.append(current_date)
-            current_date += timedelta(days=1)
+    pentecostes = get_liturgical_season_dates(year)["pentecostes"]
+    if pentecostes not in confirmation_dates:
+        bisect.insort(confirmation_dates, pentecostes)
     
-    return sorted(set(confirmation_dates))
+    return confirmation_dates
 
 
 def format_time_duration(start_time: time, end_time: time) -> str:
@@ -794,20 +972,21 @@ def get_academic_semester(reference_date: date = None) -> str:
         return f"{reference_date.year}-2"
 
 
-def is_holiday_ecuador(check_date: date) -> bool:
+@lru_cache(maxsize=16)
+def _holidays_for_year(year: int) -> frozenset:
     """
-    Verifica si una fecha es feriado en Ecuador.
+    Obtiene el conjunto de feriados de Ecuador para un año.
     
     Args:
-        check_date: Fecha a verificar
+        year: Año
         
     Returns:
-        bool: True si es feriado
+        frozenset: Fechas de feriados del año
     """
-    year = check_date.year
+    liturgical_dates = get_liturgical_season_dates(year)
     
-    # Feriados fijos
-    fixed_holidays = [
+    return frozenset([
+        # Feriados fijos
         date(year, 1, 1),   # Año Nuevo
         date(year, 5, 1),   # Día del Trabajador
         date(year, 5, 24),  # Batalla de Pichincha
@@ -816,18 +995,31 @@ def is_holiday_ecuador(check_date: date) -> bool:
         date(year, 11, 2),  # Día de los Difuntos
         date(year, 11, 3),  # Independencia de Cuenca
         date(year, 12, 25), # Navidad
-    ]
-    
-    # Feriados móviles (basados en Pascua)
-    liturgical_dates = get_liturgical_season_dates(year)
-    mobile_holidays = [
+        # Feriados móviles (basados en Pascua)
         liturgical_dates["viernes_santo"],
         liturgical_dates["miercoles_ceniza"],
-    ]
-    
-    all_holidays = fixed_holidays + mobile_holidays
+    ])
+
+
+def is_holiday_ecuador(check_date: date) -> bool:
+    """
+    Verifica si una fecha es feriado en Ecuador.
     
-    return check_date in all_holidays
+    Args:
+        check_date: Fecha a verificar
+        
+    Returns:
+        bool: True si es feriado
+    """
+    return check_date in _holidays_for_year(check_date.year)
+
+
+def _skip_weekend(day: date) -> date:
+    """Salta directamente al lunes si la fecha cae en fin de semana."""
+    weekday = day.weekday()
+    if weekday >= 5:
+        return day + timedelta(days=7 - weekday)
+    return day
 
 
 def get_next_business_day(reference_date: date = None) -> date:
@@ -843,10 +1035,10 @@ def get_next_business_day(reference_date: date = None) -> date:
     if reference_date is None:
         reference_date = get_current_date()
     
-    next_day = reference_date + timedelta(days=1)
+    next_day = _skip_weekend(reference_date + timedelta(days=1))
     
-    while next_day.weekday() >= 5 or is_holiday_ecuador(next_day):
-        next_day += timedelta(days=1)
+    while is_holiday_ecuador(next_day):
+        next_day = _skip_weekend(next_day + timedelta(days=1))
     
     return next_day
 
@@ -874,21 +1066,19 @@ def generate_attendance_calendar(year: int, group_schedule: str = "saturday") ->
     
     target_weekday = schedule_map.get(group_schedule, 5)  # Por defecto sábado
     
-    session_dates = []
-    
     # Período de catequesis: septiembre a junio
     start_date = date(year, 9, 1)
     end_date = date(year + 1, 6, 30)
     
-    current_date = start_date
-    while current_date <= end_date:
-        if current_date.weekday() == target_weekday:
-            # Excluir feriados y vacaciones
-            if not is_holiday_ecuador(current_date) and not is_vacation_period(current_date):
-                session_dates.append(current_date)
-        current_date += timedelta(days=1)
+    # Feriados de los dos años del período, resueltos una sola vez
+    holidays = _holidays_for_year(year) | _holidays_for_year(year + 1)
     
-    return session_dates
+    # Excluir feriados y vacaciones
+    return [
+        current_date
+        for current_date in get_weekday_dates(start_date, end_date, target_weekday)
+        if current_date not in holidays and not is_vacation_period(current_date)
+    ]
 
 
 def is_vacation_period(check_date: date) -> bool:
@@ -902,43 +1092,62 @@ def is_vacation_period(check_date: date) -> bool:
         bool: True si está en vacaciones
     """
     month = check_date.month
-    day = check_date.day
+    
+    # Vacaciones de verano (julio-agosto para algunas instituciones)
+    if month == 7 or month == 8:
+        return True
     
     # Vacaciones de Navidad (15 dic - 15 ene)
+    day = check_date.day
     if (month == 12 and day >= 15) or (month == 1 and day <= 15):
         return True
     
-    # Vacaciones de Semana Santa (variable)
-    year = check_date.year
-    liturgical_dates = get_liturgical_season_dates(year)
-    easter = liturgical_dates["pascua"]
-    
-    # Una semana antes y después de Pascua
-    vacation_start = easter - timedelta(days=7)
-    vacation_end = easter + timedelta(days=7)
-    
-    if vacation_start <= check_date <= vacation_end:
-        return True
+    # Vacaciones de Semana Santa: una semana antes y después de Pascua
+    # (Pascua cae entre el 22 de marzo y el 25 de abril)
+    if month < 3 or month > 5:
+        return False
     
-    # Vacaciones de verano (julio-agosto para algunas instituciones)
-    if month in [7, 8]:
-        return True
+    easter = get_easter_date(check_date.year)
+    return abs((check_date - easter).days) <= 7
+
+
+def build_session_index(calendar_dates: List[date]) -> Dict[date, int]:
+    """
+    Construye un índice fecha -> número de sesión para un calendario.
+    Conviene construirlo una sola vez y reutilizarlo en bucles.
     
-    return False
+    Args:
+        calendar_dates: Lista de fechas del calendario
+        
+    Returns:
+        dict: Número de sesión (1-based) por fecha
+    """
+    index = {}
+    for position, session_date in enumerate(calendar_dates, 1):
+        # Conservar la primera aparición, igual que list.index()
+        index.setdefault(session_date, position)
+    return index
 
 
-def calculate_session_number(session_date: date, calendar_dates: List[date]) -> int:
+def calculate_session_number(
+    session_date: date,
+    calendar_dates: Union[List[date], Dict[date, int]]
+) -> int:
     """
     Calcula el número de sesión basado en la fecha y el calendario.
     
     Args:
         session_date: Fecha de la sesión
-        calendar_dates: Lista de fechas del calendario
+        calendar_dates: Lista de fechas del calendario o índice
+            construido con build_session_index
         
     Returns:
         int: Número de sesión (1-based) o 0 si no se encuentra
     """
+    if isinstance(calendar_dates, dict):
+        return calendar_dates.get(session_date, 0)
+    
     try:
         return calendar_dates.index(session_date) + 1
     except ValueError:
-        return 0
\ No newline at end of file
+        return 0
@@ -0,0 +1,12 @@
+"""
+Utilidades de cifrado para el Sistema de Catequesis.
+Contiene el contexto de hash de contraseñas compartido por los servicios.
+"""
+
+from passlib.context import CryptContext
+
+
+# bcrypt_sha256 aplica SHA-256 antes de bcrypt: evita el truncado a 72 bytes
+# y acota el costo de contraseñas muy largas. Los hashes bcrypt previos
+# siguen siendo válidos y se marcan para rehash.
+pwd_context = CryptContext(schemes=["bcrypt_sha256", "bcrypt"], deprecated="auto")
@@ -0,0 +1,37 @@
+-- =====================================================
+-- Vista indexada: distribución de usuarios activos por rol
+-- =====================================================
+-- Equivalente SQL Server de una vista materializada. El motor la mantiene
+-- al día en cada escritura sobre usuario_rol/usuarios/rol, sin refresco manual.
+-- La lee UsuarioService._get_roles_distribution; si la vista no existe, el
+-- servicio calcula la misma agregación con el ORM:
+--   Rol.nombre, COUNT(UsuarioRol.usuario_id) ... WHERE Usuario.activo = 1
+--   GROUP BY Rol.nombre
+-- Un usuario con varios roles cuenta una vez en cada uno de ellos.
+--
+-- Ejecutar una vez por base de datos durante el despliegue.
+
+SET ANSI_NULLS ON;
+SET QUOTED_IDENTIFIER ON;
+GO
+
+IF OBJECT_ID('usuarios.vw_roles_distribution', 'V') IS NULL
+    EXEC('
+        CREATE VIEW usuarios.vw_roles_distribution WITH SCHEMABINDING AS
+        SELECT r.nombre, COUNT_BIG(*) AS n
+        FROM usuarios.usuario_rol ur
+        JOIN usuarios.rol r ON r.id = ur.rol_id
+        JOIN usuarios.usuarios u ON u.id = ur.usuario_id
+        WHERE u.activo = 1
+        GROUP BY r.nombre
+    ');
+GO
+
+IF NOT EXISTS (
+    SELECT 1 FROM sys.indexes
+    WHERE name = 'ix_vw_roles_distribution_nombre'
+      AND object_id = OBJECT_ID('usuarios.vw_roles_distribution')
+)
+    CREATE UNIQUE CLUSTERED INDEX ix_vw_roles_distribution_nombre
+    ON usuarios.vw_roles_distribution (nombre);
+GO